@@ -1,11 +1,18 @@
 from flask import Flask, request, jsonify
 import time
-import io
 import os
+import queue
+import atexit
+import io
 import base64
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+import binascii
+import hashlib
+import threading
+import http.cookiejar
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from PIL import Image
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -13,8 +20,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import requests
+import httpx
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -31,10 +38,78 @@ GPT4_API_KEY = os.getenv('GPT4_API_KEY')
 if not GPT4_API_KEY:
     raise ValueError("Missing required environment variable: GPT4_API_KEY")
 
+# Shared HTTP/2 client: concurrent captcha solves multiplex over one pooled
+# TLS connection instead of each opening their own
+OPENAI_CLIENT = httpx.Client(
+    headers={"Authorization": f"Bearer {GPT4_API_KEY}"},
+    timeout=10,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+)
+
+# Keep-alive session for downloading captcha images. Its own jar refuses every
+# cookie so one request's dgft session can't leak into another's; browser
+# cookies are passed per request and any new ones copied back to the driver.
+CAPTCHA_SESSION = requests.Session()
+CAPTCHA_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+# httpx only retries connection failures, so throttling and transient server
+# errors are retried here with backoff, honouring Retry-After when sent
+OPENAI_RETRY_STATUSES = {429, 500, 502, 503, 504}
+OPENAI_MAX_RETRIES = 2
+OPENAI_BACKOFF_FACTOR = 0.3
+OPENAI_MAX_RETRY_DELAY = 10
+
+# Concurrent solves of the same captcha; the first usable answer wins.
+# Each call is billed: an attempt sends CAPTCHA_SOLVE_FANOUT requests, plus up
+# to OPENAI_MAX_RETRIES more from the one hedged call allowed to retry, and a
+# lookup makes up to five attempts. Set CAPTCHA_SOLVE_FANOUT=1 to disable hedging.
+CAPTCHA_SOLVE_FANOUT = max(1, int(os.getenv('CAPTCHA_SOLVE_FANOUT', 3)))
+
+# Longest captcha edge sent to the vision API; larger images only add bytes
+CAPTCHA_MAX_EDGE = 400
+
+# Captcha answers that dgft accepted, keyed by a digest of the image, so a
+# repeated challenge skips the API. Only confirmed answers are stored.
+SOLVED_CAPTCHAS = OrderedDict()
+SOLVED_CAPTCHAS_LOCK = threading.Lock()
+SOLVED_CAPTCHAS_MAXSIZE = 1024
+
+# Idle Chrome drivers kept parked on the IEC form between requests, stored
+# as (driver, parked_at) pairs. Parking happens off the request thread.
+IEC_FORM_URL = "https://dgft.gov.in/CP/?opt=view-any-ice"
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', 3))
+DRIVER_POOL = queue.Queue(maxsize=DRIVER_POOL_SIZE)
+DRIVER_EXECUTOR = ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE)
+# Re-open the form if a parked page is older than this; its captcha session may have expired
+PARKED_FORM_MAX_AGE = 300
+# Opt-in warmup, started by the first acquire_driver call so browsers and
+# executor threads live in the serving process, not a gunicorn --preload master
+WARM_DRIVER_POOL = os.getenv('WARM_DRIVER_POOL', 'false').lower() == 'true'
+DRIVER_POOL_WARMUP_LOCK = threading.Lock()
+driver_pool_warmed = False
+
 class IECScraperException(Exception):
     """Custom exception for IEC scraping errors"""
     pass
 
+# Static assets the scraper never reads. Matched by file extension so the
+# dynamically served captcha image and the stylesheets (needed for the
+# visibility/clickability waits) still load.
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm"
+]
+
+@lru_cache(maxsize=None)
+def get_chromedriver_path():
+    """Resolve the ChromeDriver binary once per process; webdriver_manager hits the network on every install()"""
+    return ChromeDriverManager().install()
+
 def create_driver():
     """Create a Chrome WebDriver instance configured for Render deployment"""
     options = Options()
@@ -45,7 +120,6 @@ def create_driver():
     options.add_argument('--disable-software-rasterizer')
     options.add_argument('--disable-extensions')
     options.add_argument('--single-process')
-    options.add_argument('--remote-debugging-port=9222')
     options.add_argument('--disable-setuid-sandbox')
     options.add_argument('--window-size=1920,1080')
     options.page_load_strategy = 'eager'
@@ -68,12 +142,14 @@ def create_driver():
         options.binary_location = chrome_binary
     
     try:
-        # Install ChromeDriver using webdriver_manager
-        driver_path = ChromeDriverManager().install()
+        # Install ChromeDriver using webdriver_manager (cached after the first call)
+        driver_path = get_chromedriver_path()
         service = ChromeService(executable_path=driver_path)
         
         # Create and return the WebDriver instance
         driver = webdriver.Chrome(service=service, options=options)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
         return driver
     except Exception as e:
         # Log more detailed error information
@@ -87,52 +163,273 @@ def create_driver():
         print("Chrome driver creation error details:", error_details)
         raise IECScraperException(f"Failed to create Chrome driver: {str(e)}\nDetails: {error_details}")
 
-def capture_captcha_section(driver):
+def open_iec_form(driver):
+    """Navigate to the View Any IEC form and wait until its inputs are present"""
+    wait = WebDriverWait(driver, 5)
+    
+    driver.get(IEC_FORM_URL)
+    
+    view_any_iec_button = wait.until(EC.element_to_be_clickable(
+        (By.XPATH, "/html/body/div[2]/div[9]/div[3]/div/div[2]/div[1]/div/a")))
+    view_any_iec_button.click()
+    
+    wait.until(EC.presence_of_element_located((By.XPATH, '//*[@id="iecNo"]')))
+
+def is_iec_form_ready(driver):
+    return driver.execute_script(
+        "const input = document.getElementById('iecNo'); return !!input && !input.value;")
+
+def acquire_driver():
+    """Take a driver parked on the IEC form, or start and park a new one if none is idle"""
+    global driver_pool_warmed
+    if WARM_DRIVER_POOL and not driver_pool_warmed:
+        with DRIVER_POOL_WARMUP_LOCK:
+            if not driver_pool_warmed:
+                driver_pool_warmed = True
+                # This caller starts its own driver below, so warm one fewer
+                warm_driver_pool(DRIVER_POOL_SIZE - 1)
+    
+    while True:
+        try:
+            driver, parked_at = DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            driver = create_driver()
+            try:
+                open_iec_form(driver)
+            except Exception:
+                quit_driver(driver)
+                raise
+            return driver
+        
+        # Re-navigate if the parked page drifted or went stale; drop drivers whose browser died
+        try:
+            if time.monotonic() - parked_at > PARKED_FORM_MAX_AGE or not is_iec_form_ready(driver):
+                open_iec_form(driver)
+            return driver
+        except Exception:
+            quit_driver(driver)
+
+def park_driver(driver):
+    """Reset a driver onto a fresh IEC form and add it to the pool"""
+    # Don't pay a page load for a driver that has nowhere to go
+    if DRIVER_POOL.full():
+        quit_driver(driver)
+        return
+    
+    # Any failure, including a dead chromedriver surfacing as a urllib3 error,
+    # must quit the driver: exceptions here are lost in the executor future
     try:
-        captcha_element = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.XPATH, '//*[@id="captcha"]'))
-        )
+        driver.delete_all_cookies()
+        open_iec_form(driver)
+        DRIVER_POOL.put_nowait((driver, time.monotonic()))
+    except Exception:
+        quit_driver(driver)
+
+def release_driver(driver, reusable=True):
+    """Hand a driver back for parking; broken drivers are quit"""
+    if reusable:
+        DRIVER_EXECUTOR.submit(park_driver, driver)
+    else:
+        quit_driver(driver)
+
+def warm_driver():
+    try:
+        park_driver(create_driver())
+    except IECScraperException as e:
+        print(f"Driver pool warmup error: {str(e)}")
+
+def warm_driver_pool(count=DRIVER_POOL_SIZE):
+    """Start and park count drivers in the background"""
+    for _ in range(count):
+        DRIVER_EXECUTOR.submit(warm_driver)
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+@atexit.register
+def close_driver_pool():
+    while True:
+        try:
+            driver, _ = DRIVER_POOL.get_nowait()
+            quit_driver(driver)
+        except queue.Empty:
+            break
+
+# Sets an input's value in one round-trip instead of a keystroke per character
+SET_INPUT_VALUE_SCRIPT = """
+const input = arguments[0];
+input.value = arguments[1];
+input.dispatchEvent(new Event('input', {bubbles: true}));
+input.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+def set_input_value(driver, element, value):
+    driver.execute_script(SET_INPUT_VALUE_SCRIPT, element, value)
+
+def limit_captcha_size(data_url):
+    """Downscale a data URL image whose long edge exceeds CAPTCHA_MAX_EDGE"""
+    header, _, encoded = data_url.partition(',')
+    if ';base64' not in header:
+        return data_url
+    
+    # Image.open only parses the header here; pixels are decoded if we resize.
+    # Anything PIL can't read (SVG, bad base64, decompression bombs) is passed
+    # through unchanged.
+    try:
+        captcha_image = Image.open(io.BytesIO(base64.b64decode(encoded)))
+        if max(captcha_image.size) <= CAPTCHA_MAX_EDGE:
+            return data_url
         
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", captcha_element)
+        # JPEG has no alpha: flatten transparency onto white so dark captcha
+        # text on a transparent background doesn't turn into black on black
+        if captcha_image.mode in ("RGBA", "LA", "PA") or "transparency" in captcha_image.info:
+            rgba_image = captcha_image.convert("RGBA")
+            captcha_image = Image.new("RGB", rgba_image.size, "white")
+            captcha_image.paste(rgba_image, mask=rgba_image.getchannel("A"))
+        else:
+            captcha_image = captcha_image.convert("RGB")
         
-        pixel_ratio = driver.execute_script("return window.devicePixelRatio;")
-        location = captcha_element.location_once_scrolled_into_view
-        size = captcha_element.size
+        captcha_image.thumbnail((CAPTCHA_MAX_EDGE, CAPTCHA_MAX_EDGE), Image.Resampling.LANCZOS)
+    except (OSError, binascii.Error, Image.DecompressionBombError):
+        return data_url
+    
+    buffered = io.BytesIO()
+    captcha_image.save(buffered, format="JPEG", quality=85, optimize=True)
+    return f"data:image/jpeg;base64,{base64.b64encode(buffered.getvalue()).decode()}"
+
+def fetch_captcha_image(driver, src):
+    """Download the captcha with the browser's session and return it as a data URL.
+
+    Returns None if the response isn't an image (e.g. a login or error page).
+    """
+    page = driver.execute_script(
+        "return {userAgent: navigator.userAgent, url: location.href, host: location.hostname};")
+    
+    # Keep each cookie's domain and path so the jar only sends the ones that match src
+    cookies = requests.cookies.RequestsCookieJar()
+    for cookie in driver.get_cookies():
+        cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''),
+                    path=cookie.get('path', '/'), secure=cookie.get('secure', False))
+    
+    # Present the side request as the browser session it reuses
+    headers = {"User-Agent": page['userAgent'], "Referer": page['url']}
+    response = CAPTCHA_SESSION.get(src, cookies=cookies, headers=headers, timeout=5)
+    response.raise_for_status()
+    
+    if response.cookies:
+        copy_cookies_to_driver(driver, response.cookies, page['host'])
+    
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+    if not content_type.startswith('image/'):
+        return None
+    return f"data:{content_type};base64,{base64.b64encode(response.content).decode()}"
+
+def copy_cookies_to_driver(driver, cookies, page_host):
+    """Copy cookies set by the captcha response into the browser so the answer is submitted in the same session"""
+    for cookie in cookies:
+        domain = cookie.domain.lstrip('.')
+        # The browser only accepts cookies for the page it is on
+        if page_host != domain and not page_host.endswith(f".{domain}"):
+            continue
         
-        png = driver.get_screenshot_as_png()
-        screenshot = Image.open(io.BytesIO(png))
+        browser_cookie = {
+            'name': cookie.name,
+            'value': cookie.value,
+            'path': cookie.path or '/',
+            'secure': bool(cookie.secure)
+        }
+        if cookie.domain_specified:
+            browser_cookie['domain'] = cookie.domain
+        if cookie.expires:
+            browser_cookie['expiry'] = cookie.expires
         
-        padding = 5
-        left = int(location['x'] * pixel_ratio) - padding
-        top = int(location['y'] * pixel_ratio) - padding
-        right = int((location['x'] + size['width']) * pixel_ratio) + padding
-        bottom = int((location['y'] + size['height']) * pixel_ratio) + padding
+        try:
+            driver.add_cookie(browser_cookie)
+        except WebDriverException as e:
+            print(f"Could not copy captcha cookie {cookie.name}: {str(e)}")
+
+def screenshot_captcha(driver, captcha_element):
+    """Capture just the captcha's bounding box as a JPEG data URL"""
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", captcha_element)
+    
+    rect = driver.execute_script(
+        "const r = arguments[0].getBoundingClientRect();"
+        "return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};",
+        captcha_element
+    )
+    
+    padding = 5
+    width = rect['width'] + 2 * padding
+    height = rect['height'] + 2 * padding
+    
+    # Upscale small captchas to 200px wide and cap large ones at CAPTCHA_MAX_EDGE
+    # while Chrome renders the clip
+    scale = 200 / rect['width'] if 0 < rect['width'] < 100 else 1
+    scale = min(scale, CAPTCHA_MAX_EDGE / max(width, height))
+    
+    screenshot = driver.execute_cdp_cmd("Page.captureScreenshot", {
+        "format": "jpeg",
+        "quality": 85,
+        "clip": {
+            "x": max(rect['x'] - padding, 0),
+            "y": max(rect['y'] - padding, 0),
+            "width": width,
+            "height": height,
+            "scale": scale
+        },
+        "captureBeyondViewport": True
+    })
+    
+    return f"data:image/jpeg;base64,{screenshot['data']}"
+
+def capture_captcha_section(driver):
+    """Return the current captcha as a data URL ready for the vision API"""
+    try:
+        captcha_element = WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.XPATH, '//*[@id="captcha"]'))
+        )
         
-        captcha_image = screenshot.crop((left, top, right, bottom))
+        src = driver.execute_script(
+            "return arguments[0].tagName === 'IMG' ? arguments[0].src : null;", captcha_element)
         
-        if captcha_image.size[0] < 100:
-            new_width = 200
-            ratio = new_width / captcha_image.size[0]
-            new_height = int(captcha_image.size[1] * ratio)
-            captcha_image = captcha_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # An <img> captcha can be used as-is (data URL) or fetched directly
+        if src and src.startswith("data:"):
+            return limit_captcha_size(src)
+        if src:
+            try:
+                captcha_image = fetch_captcha_image(driver, src)
+            except requests.RequestException as e:
+                print(f"Captcha download error: {str(e)}")
+                captcha_image = None
+            if captcha_image:
+                return limit_captcha_size(captcha_image)
         
-        return captcha_image
+        # Anything else (e.g. a canvas), or a download that failed, falls back
+        # to a clipped screenshot
+        return screenshot_captcha(driver, captcha_element)
     except TimeoutException:
         return None
 
-def solve_captcha_with_gpt4(captcha_image):
+def openai_retry_delay(response, retry):
+    """Seconds to wait before retrying: Retry-After if numeric, else exponential backoff"""
+    try:
+        delay = float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        delay = OPENAI_BACKOFF_FACTOR * (2 ** retry)
+    return min(max(delay, 0), OPENAI_MAX_RETRY_DELAY)
+
+def solve_captcha_with_gpt4(captcha_image, retry_claim=None):
+    """Ask the vision model for the captcha text.
+
+    Hedged calls share a retry_claim lock: only the call that acquires it
+    retries throttled or failed responses, the others give up at once.
+    """
     if not captcha_image:
         return None
         
-    buffered = io.BytesIO()
-    captcha_image.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
-    
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {GPT4_API_KEY}"
-    }
-    
     payload = {
         "model": "gpt-4-turbo",
         "messages": [
@@ -146,7 +443,8 @@ def solve_captcha_with_gpt4(captcha_image):
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{img_str}"
+                            "url": captcha_image,
+                            "detail": "low"
                         }
                     }
                 ]
@@ -156,44 +454,115 @@ def solve_captcha_with_gpt4(captcha_image):
     }
     
     try:
-        with requests.Session() as session:
-            response = session.post(
+        holds_retry_claim = retry_claim is None
+        for retry in range(OPENAI_MAX_RETRIES + 1):
+            response = OPENAI_CLIENT.post(
                 "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=10
+                json=payload
             )
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"].strip()
+            if response.status_code not in OPENAI_RETRY_STATUSES or retry == OPENAI_MAX_RETRIES:
+                break
+            if not holds_retry_claim:
+                holds_retry_claim = retry_claim.acquire(blocking=False)
+                if not holds_retry_claim:
+                    break
+            time.sleep(openai_retry_delay(response, retry))
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"].strip()
     except Exception as e:
         raise IECScraperException(f"GPT-4 API error: {str(e)}")
 
-def extract_table_data_with_bs4(driver, table_id, delimiter=";"):
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    table = soup.find('table', {'id': table_id})
-    
-    if not table:
-        return ""
-    
-    rows = []
+def solve_captcha_hedged(captcha_image):
+    """Race several solves of the same captcha and return the first non-empty answer.
+
+    Only the captcha currently on the page is accepted by dgft, so attempts
+    can't be spread over refreshed images; hedging cuts the tail latency of
+    the slowest API call instead.
+    """
+    if not captcha_image:
+        return None
     
-    # Extract headers
-    thead = table.find('thead')
-    if thead:
-        headers = [th.get_text(strip=True) for th in thead.find_all('th')]
-        if any(headers):
-            rows.append(delimiter.join(headers))
+    # A running call can't be cancelled, so each attempt gets its own
+    # executor: losing calls finish on their own threads instead of holding
+    # shared workers that other requests' solves would queue behind
+    executor = ThreadPoolExecutor(max_workers=CAPTCHA_SOLVE_FANOUT)
+    retry_claim = threading.Lock()
+    futures = [executor.submit(solve_captcha_with_gpt4, captcha_image, retry_claim)
+               for _ in range(CAPTCHA_SOLVE_FANOUT)]
+    executor.shutdown(wait=False)
     
-    # Extract rows
-    tbody = table.find('tbody')
-    if tbody:
-        for row in tbody.find_all('tr'):
-            cols = row.find_all('td')
-            row_data = [' '.join(col.get_text(strip=True).split()) for col in cols]
-            if any(row_data):
-                rows.append(delimiter.join(row_data))
+    for future in as_completed(futures):
+        try:
+            captcha_text = future.result()
+        except IECScraperException as e:
+            print(f"Captcha solve error: {str(e)}")
+            continue
+        if captcha_text:
+            return captcha_text
     
-    return rows
+    return None
+
+def captcha_digest(captcha_image):
+    return hashlib.sha256(captcha_image.encode()).hexdigest()
+
+def get_solved_captcha(digest):
+    with SOLVED_CAPTCHAS_LOCK:
+        captcha_text = SOLVED_CAPTCHAS.get(digest)
+        if captcha_text is not None:
+            SOLVED_CAPTCHAS.move_to_end(digest)
+        return captcha_text
+
+def remember_solved_captcha(digest, captcha_text):
+    with SOLVED_CAPTCHAS_LOCK:
+        SOLVED_CAPTCHAS[digest] = captcha_text
+        SOLVED_CAPTCHAS.move_to_end(digest)
+        if len(SOLVED_CAPTCHAS) > SOLVED_CAPTCHAS_MAXSIZE:
+            SOLVED_CAPTCHAS.popitem(last=False)
+
+# Reads a table's header and body cells from the live DOM in a single round-trip.
+# With arguments[1] set, body rows come from every page of a client-side
+# DataTable instead of the rendered page; null means that isn't available.
+TABLE_ROWS_SCRIPT = """
+const table = document.getElementById(arguments[0]);
+if (!table) return [];
+let bodyRows = table.querySelectorAll('tbody tr');
+if (arguments[1]) {
+    try {
+        const $ = window.jQuery;
+        if (!$ || !$.fn.dataTable || !$.fn.dataTable.isDataTable(table)) return null;
+        const api = $(table).DataTable();
+        if (api.settings()[0].oFeatures.bServerSide) return null;
+        // Same rows, order and filtering as the paged view shows
+        const dataRows = api.rows({order: 'applied', search: 'applied'}).nodes().toArray();
+        // Deferred rendering leaves rows on unvisited pages without nodes
+        if (dataRows.some(row => !row)) return null;
+        // An empty table keeps the rendered "No data available" row, as the paged path does
+        if (dataRows.length) bodyRows = dataRows;
+    } catch (e) {
+        return null;
+    }
+}
+const cellText = cell => cell.textContent.trim().replace(/\\s+/g, ' ');
+const rows = [];
+const headers = [...table.querySelectorAll('thead th')].map(cellText);
+if (headers.some(Boolean)) rows.push(headers);
+for (const tr of bodyRows) {
+    const cells = [...tr.querySelectorAll('td')].map(cellText);
+    if (cells.some(Boolean)) rows.push(cells);
+}
+return rows;
+"""
+
+def extract_table_data(driver, table_id, delimiter=";", all_pages=False):
+    """Return the table's rows as delimited strings.
+
+    With all_pages, rows are read from every page of a client-side DataTable
+    in one call; None is returned if the table isn't one.
+    """
+    rows = driver.execute_script(TABLE_ROWS_SCRIPT, table_id, all_pages)
+    if rows is None:
+        return None
+    return [delimiter.join(row) for row in rows]
 
 def extract_table_data_with_pagination(driver, table_id, next_button_id, delimiter=";"):
     """Extract table data with pagination support and return as newline-separated string"""
@@ -207,8 +576,14 @@ def extract_table_data_with_pagination(driver, table_id, next_button_id, delimit
             wait.until(EC.presence_of_element_located((By.ID, table_id)))
             wait.until(lambda d: len(d.find_elements(By.CSS_SELECTOR, f"#{table_id} tbody tr")) > 0)
             
+            # A client-side DataTable already holds every page; read them all at once
+            if page == 1:
+                all_page_rows = extract_table_data(driver, table_id, delimiter, all_pages=True)
+                if all_page_rows is not None:
+                    return "\n".join(all_page_rows)
+            
             # Extract current page data
-            current_page_rows = extract_table_data_with_bs4(driver, table_id, delimiter)
+            current_page_rows = extract_table_data(driver, table_id, delimiter)
             
             # For first page, include headers; for subsequent pages, skip headers
             if page == 1:
@@ -222,9 +597,10 @@ def extract_table_data_with_pagination(driver, table_id, next_button_id, delimit
                 if "disabled" in next_button.get_attribute("class"):
                     break
                     
-                # Click next button and wait for table update
+                # Click next button and wait for the current rows to be replaced
+                first_row = driver.find_element(By.CSS_SELECTOR, f"#{table_id} tbody tr")
                 next_button.click()
-                time.sleep(1)  # Short delay to allow table to update
+                wait.until(EC.staleness_of(first_row))
                 page += 1
                 
             except (NoSuchElementException, TimeoutException):
@@ -237,24 +613,24 @@ def extract_table_data_with_pagination(driver, table_id, next_button_id, delimit
     # Join all rows with newline character
     return "\n".join(all_rows)
 
+# Collects every form-group's label/value pair in a single round-trip
+FORM_GROUP_PAIRS_SCRIPT = """
+return [...document.getElementsByClassName('form-group')].map(group => {
+    const label = group.querySelector('label'), value = group.querySelector('p');
+    return label && value ? [label.innerText.trim(), value.innerText.trim()] : null;
+}).filter(Boolean);
+"""
+
 def extract_iec_details(driver):
-    details = []
     wait = WebDriverWait(driver, 10)
     
     try:
-        form_groups = wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "form-group")))
-        for form_group in form_groups:
-            try:
-                label = form_group.find_element(By.TAG_NAME, "label").text.strip()
-                value = form_group.find_element(By.TAG_NAME, "p").text.strip()
-                if label and value:
-                    details.append(f"{label};{value}")
-            except NoSuchElementException:
-                continue
+        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "form-group")))
+        pairs = driver.execute_script(FORM_GROUP_PAIRS_SCRIPT)
     except Exception as e:
         raise IECScraperException(f"Error extracting IEC details: {str(e)}")
     
-    return "\n".join(details)
+    return "\n".join(f"{label};{value}" for label, value in pairs if label and value)
 
 def handle_captcha_submission(driver):
     max_attempts = 5
@@ -264,7 +640,12 @@ def handle_captcha_submission(driver):
     while attempt < max_attempts:
         try:
             captcha_image = capture_captcha_section(driver)
-            captcha_text = solve_captcha_with_gpt4(captcha_image)
+            if not captcha_image:
+                attempt += 1
+                continue
+            
+            digest = captcha_digest(captcha_image)
+            captcha_text = get_solved_captcha(digest) or solve_captcha_hedged(captcha_image)
             
             if not captcha_text:
                 attempt += 1
@@ -281,6 +662,7 @@ def handle_captcha_submission(driver):
                 success = wait.until(EC.presence_of_element_located(
                     (By.XPATH, '/html/body/div[2]/div[9]/div/div/div[1]/div/div/div[1]/div[1]/h6')))
                 if "IEC Details" in success.text:
+                    remember_solved_captcha(digest, captcha_text)
                     return True
             except TimeoutException:
                 pass
@@ -306,21 +688,15 @@ def get_iec_details():
         name = data['name']
         
         driver = None
+        reusable = True
         try:
-            driver = create_driver()
-            wait = WebDriverWait(driver, 5)
-            
-            driver.get("https://dgft.gov.in/CP/?opt=view-any-ice")
-            
-            view_any_iec_button = wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "/html/body/div[2]/div[9]/div[3]/div/div[2]/div[1]/div/a")))
-            view_any_iec_button.click()
+            driver = acquire_driver()
             
-            iec_input = wait.until(EC.presence_of_element_located((By.XPATH, '//*[@id="iecNo"]')))
+            iec_input = driver.find_element(By.XPATH, '//*[@id="iecNo"]')
             name_input = driver.find_element(By.XPATH, '//*[@id="entity"]')
             
-            iec_input.send_keys(iec_code)
-            name_input.send_keys(name)
+            set_input_value(driver, iec_input, iec_code)
+            set_input_value(driver, name_input, name)
             
             if not handle_captcha_submission(driver):
                 return jsonify({
@@ -340,13 +716,14 @@ def get_iec_details():
             })
             
         except Exception as e:
+            reusable = False
             return jsonify({
                 'success': False,
                 'error': str(e)
             }), 500
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver, reusable)
             
     except Exception as e:
         return jsonify({